@@ -1,12 +1,23 @@
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, render_template, request, jsonify, send_file, Response
 import os
+import io
 import json
 import tempfile
+import threading
+import http.cookiejar
+from concurrent.futures import ThreadPoolExecutor, wait
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import time
 from wsdl_parser import WSDLParser
 from swagger_generator import SwaggerGenerator
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup, fall back to stdlib json
+    orjson = None
+
 app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
@@ -15,6 +26,203 @@ STORAGE_DIR = os.path.join(os.path.dirname(__file__), 'storage')
 if not os.path.exists(STORAGE_DIR):
     os.makedirs(STORAGE_DIR)
 
+# Shared session so repeated URL fetches reuse pooled connections
+_HTTP = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=20,
+                            max_retries=Retry(total=2, backoff_factor=0.2))
+_HTTP.mount('http://', _HTTP_ADAPTER)
+_HTTP.mount('https://', _HTTP_ADAPTER)
+# URLs come from different users, so never carry cookies from one fetch to the next
+_HTTP.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+# Background writers for the per-conversion output files
+_IO_POOL = ThreadPoolExecutor(max_workers=4)
+
+# mkstemp creates files as 0600; stored files get the usual umask-based mode
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_FILE_MODE = 0o666 & ~_UMASK
+
+def _json_dumps(obj, pretty=False):
+    """Serialize obj to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def _json_loads(data):
+    """Deserialize JSON bytes or str, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_response(obj, status=200):
+    """Build a JSON response without going through jsonify"""
+    return Response(_json_dumps(obj), status=status, mimetype='application/json')
+
+def _write_atomic(path, data):
+    """Write bytes to path via a temp file in the same directory and os.replace"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            os.fchmod(f.fileno(), _FILE_MODE)
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+# Prolog constructs that may precede the root element, with their terminators
+_XML_PROLOG = ((b'<?', b'?>'), (b'<!--', b'-->'), (b'<!DOCTYPE', b'>'))
+
+def _looks_like_wsdl(wsdl_content):
+    """Cheap check on the root element so obviously non-WSDL input never reaches the parser"""
+    if isinstance(wsdl_content, str):
+        wsdl_content = wsdl_content.encode('utf-8', 'ignore')
+    
+    # Skip the XML declaration, comments, processing instructions and DOCTYPE
+    pos = len(wsdl_content) - len(wsdl_content.lstrip(b'\xef\xbb\xbf \t\r\n'))
+    while True:
+        for start, end in _XML_PROLOG:
+            if wsdl_content.startswith(start, pos):
+                search_from = pos + len(start)
+                if start == b'<!DOCTYPE':
+                    # An internal subset can contain '>' of its own
+                    bracket = wsdl_content.find(b'[', pos, wsdl_content.find(b'>', pos))
+                    if bracket != -1:
+                        search_from = wsdl_content.find(b']', bracket)
+                        if search_from == -1:
+                            return False
+                close = wsdl_content.find(end, search_from)
+                if close == -1:
+                    return False
+                pos = close + len(end)
+                while pos < len(wsdl_content) and wsdl_content[pos] in b' \t\r\n':
+                    pos += 1
+                break
+        else:
+            break
+    
+    # WSDL is XML, and its namespace is declared on the root element
+    head = wsdl_content[pos:pos + 2048]
+    return head.startswith(b'<') and b'wsdl' in head.lower()
+
+# Metadata is an append-only log with one JSON object per line: either a
+# file_info record or a {"id": ..., "deleted": true} tombstone. The log is
+# compacted in the background once enough superseded lines pile up.
+_COMPACT_AFTER = 100
+
+# Replayed metadata indexed by file id, reused until the log's mtime changes.
+# 'lines' counts records in the log and 'raw' caches the /api/files body.
+_META_CACHE = {'mtime': 0, 'data': None, 'lines': 0, 'raw': None, 'lock': threading.RLock()}
+
+def _replay_metadata(raw):
+    """Rebuild {file_id: file_info} from log bytes, returning it with the line count"""
+    meta = {}
+    lines = 0
+    for line in raw.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = _json_loads(line)
+        except ValueError:
+            # Torn line left by an interrupted append
+            continue
+        
+        lines += 1
+        if record.get('deleted'):
+            meta.pop(record['id'], None)
+        else:
+            meta[record['id']] = record
+    
+    return meta, lines
+
+def _migrate_metadata_json():
+    """Convert a legacy metadata.json list into the log, returning False if there is none"""
+    legacy_file = os.path.join(STORAGE_DIR, 'metadata.json')
+    try:
+        with open(legacy_file, 'rb') as f:
+            files = _json_loads(f.read())
+    except FileNotFoundError:
+        return False
+    
+    _save_metadata({file_info['id']: file_info for file_info in files})
+    os.remove(legacy_file)
+    return True
+
+def _load_metadata():
+    """Return metadata as {file_id: file_info}, or None if no metadata exists yet"""
+    log_file = os.path.join(STORAGE_DIR, 'metadata.log')
+    with _META_CACHE['lock']:
+        try:
+            mtime = os.stat(log_file).st_mtime_ns
+        except FileNotFoundError:
+            if not _migrate_metadata_json():
+                return None
+            mtime = os.stat(log_file).st_mtime_ns
+        
+        if _META_CACHE['data'] is None or _META_CACHE['mtime'] != mtime:
+            with open(log_file, 'rb') as f:
+                raw = f.read()
+            meta, lines = _replay_metadata(raw)
+            _META_CACHE.update(data=meta, lines=lines, raw=None, mtime=mtime)
+            
+            # Rewrite a log with a torn tail so the next append starts on a fresh line
+            if raw and not raw.endswith(b'\n'):
+                _save_metadata(meta)
+        
+        return _META_CACHE['data']
+
+def _save_metadata(meta):
+    """Atomically rewrite the log with just the live records in meta"""
+    log_file = os.path.join(STORAGE_DIR, 'metadata.log')
+    with _META_CACHE['lock']:
+        data = b''.join(_json_dumps(file_info) + b'\n' for file_info in meta.values())
+        try:
+            _write_atomic(log_file, data)
+        except BaseException:
+            # meta may have been mutated in place; force a reload from disk
+            _META_CACHE['data'] = None
+            raise
+        
+        _META_CACHE.update(data=meta, lines=len(meta), raw=None,
+                           mtime=os.stat(log_file).st_mtime_ns)
+
+def _append_metadata(record):
+    """Append a record or tombstone to the log and apply it to the cache"""
+    log_file = os.path.join(STORAGE_DIR, 'metadata.log')
+    with _META_CACHE['lock']:
+        meta = _load_metadata()
+        if meta is None:
+            meta = {}
+        
+        fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, _FILE_MODE)
+        try:
+            os.write(fd, _json_dumps(record) + b'\n')
+        finally:
+            os.close(fd)
+        
+        if record.get('deleted'):
+            meta.pop(record['id'], None)
+        else:
+            meta[record['id']] = record
+        _META_CACHE.update(data=meta, lines=_META_CACHE['lines'] + 1, raw=None,
+                           mtime=os.stat(log_file).st_mtime_ns)
+        
+        if _META_CACHE['lines'] - len(meta) >= _COMPACT_AFTER:
+            _IO_POOL.submit(_compact_metadata)
+
+def _compact_metadata():
+    """Drop superseded lines from the log if it is still worth doing"""
+    with _META_CACHE['lock']:
+        meta = _load_metadata()
+        if meta is not None and _META_CACHE['lines'] - len(meta) >= _COMPACT_AFTER:
+            _save_metadata(meta)
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -28,22 +236,25 @@ def convert_wsdl():
         if 'wsdl_file' in request.files and request.files['wsdl_file'].filename:
             # File upload
             file = request.files['wsdl_file']
-            wsdl_content = file.read().decode('utf-8')
+            wsdl_content = file.read()
         elif request.form.get('wsdl_text'):
             # Text input
             wsdl_content = request.form.get('wsdl_text')
         elif request.form.get('wsdl_url'):
             # URL input
             url = request.form.get('wsdl_url')
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            wsdl_content = response.text
+            with _HTTP.get(url, timeout=(5, 25), stream=True) as response:
+                response.raise_for_status()
+                wsdl_content = response.content
         else:
             return jsonify({'error': 'No WSDL input provided'}), 400
         
         if not wsdl_content:
             return jsonify({'error': 'Empty WSDL content'}), 400
         
+        if not _looks_like_wsdl(wsdl_content):
+            return jsonify({'error': 'Input does not look like a WSDL document'}), 400
+        
         # Parse WSDL
         parser = WSDLParser()
         wsdl_data = parser.parse(wsdl_content)
@@ -53,13 +264,15 @@ def convert_wsdl():
         swagger_spec = generator.generate(wsdl_data)
         
         # Save the converted file
-        file_id = save_converted_file(wsdl_data.get('name', 'UnknownService'), swagger_spec, wsdl_content)
+        file_id, swagger_json = save_converted_file(wsdl_data.get('name', 'UnknownService'), swagger_spec,
+                                                    wsdl_content, generator=generator)
         
-        return jsonify({
-            'success': True,
-            'swagger': swagger_spec,
-            'file_id': file_id
-        })
+        # Embed the already-serialized spec instead of encoding it a second time
+        body = b''.join([
+            b'{"success":true,"file_id":', _json_dumps(file_id),
+            b',"swagger":', swagger_json, b'}'
+        ])
+        return Response(body, mimetype='application/json')
         
     except requests.RequestException as e:
         return jsonify({'error': f'Failed to fetch WSDL from URL: {str(e)}'}), 400
@@ -73,57 +286,77 @@ def manage():
 @app.route('/api/files')
 def list_files():
     """Get list of all converted files"""
-    files = []
-    metadata_file = os.path.join(STORAGE_DIR, 'metadata.json')
-    
-    if os.path.exists(metadata_file):
-        with open(metadata_file, 'r') as f:
-            files = json.load(f)
+    # The encoded listing is cached until the metadata next changes
+    with _META_CACHE['lock']:
+        meta = _load_metadata()
+        if meta is None:
+            body = b'[]'
+        else:
+            if _META_CACHE['raw'] is None:
+                _META_CACHE['raw'] = _json_dumps(list(meta.values()))
+            body = _META_CACHE['raw']
     
-    return jsonify(files)
+    return Response(body, mimetype='application/json')
+
+def _get_file_info(file_id):
+    """Return the metadata entry for file_id, or None if it is unknown"""
+    meta = _load_metadata()
+    return meta.get(file_id) if meta is not None else None
 
 @app.route('/api/files/<file_id>')
 def get_file(file_id):
     """Get specific file content"""
-    metadata_file = os.path.join(STORAGE_DIR, 'metadata.json')
-    
-    if os.path.exists(metadata_file):
-        with open(metadata_file, 'r') as f:
-            files = json.load(f)
-        
-        for file_info in files:
-            if file_info['id'] == file_id:
-                file_path = os.path.join(STORAGE_DIR, f"{file_id}.json")
-                if os.path.exists(file_path):
-                    with open(file_path, 'r') as f:
-                        swagger_content = json.load(f)
-                    return jsonify({
-                        'metadata': file_info,
-                        'swagger': swagger_content
-                    })
+    file_info = _get_file_info(file_id)
+    
+    if file_info is not None:
+        file_path = os.path.join(STORAGE_DIR, f"{file_id}.json")
+        if os.path.exists(file_path):
+            # The stored spec is already JSON, so embed it without parsing
+            with open(file_path, 'rb') as f:
+                swagger_json = f.read()
+            body = b''.join([
+                b'{"metadata":', _json_dumps(file_info),
+                b',"swagger":', swagger_json, b'}'
+            ])
+            return Response(body, mimetype='application/json')
+    
+    return jsonify({'error': 'File not found'}), 404
+
+@app.route('/api/files/<file_id>/meta')
+def get_file_meta(file_id):
+    """Get metadata for a specific file"""
+    file_info = _get_file_info(file_id)
+    if file_info is not None:
+        return _json_response(file_info)
+    
+    return jsonify({'error': 'File not found'}), 404
+
+@app.route('/api/files/<file_id>/swagger')
+def get_file_swagger(file_id):
+    """Get the stored Swagger spec for a specific file"""
+    if _get_file_info(file_id) is not None:
+        file_path = os.path.join(STORAGE_DIR, f"{file_id}.json")
+        if os.path.exists(file_path):
+            return send_file(file_path, mimetype='application/json')
     
     return jsonify({'error': 'File not found'}), 404
 
 @app.route('/api/files/<file_id>', methods=['DELETE'])
 def delete_file(file_id):
     """Delete a converted file"""
-    metadata_file = os.path.join(STORAGE_DIR, 'metadata.json')
+    with _META_CACHE['lock']:
+        meta = _load_metadata()
+        if meta is not None and file_id in meta:
+            # Remove file from metadata
+            _append_metadata({'id': file_id, 'deleted': True})
     
-    if os.path.exists(metadata_file):
-        with open(metadata_file, 'r') as f:
-            files = json.load(f)
-        
-        # Remove file from metadata
-        files = [f for f in files if f['id'] != file_id]
-        
-        with open(metadata_file, 'w') as f:
-            json.dump(files, f, indent=2)
-        
+    if meta is not None:
         # Remove actual files
         for ext in ['.json', '.yaml', '.wsdl']:
-            file_path = os.path.join(STORAGE_DIR, f"{file_id}{ext}")
-            if os.path.exists(file_path):
-                os.remove(file_path)
+            try:
+                os.remove(os.path.join(STORAGE_DIR, f"{file_id}{ext}"))
+            except FileNotFoundError:
+                pass
         
         return jsonify({'success': True})
     
@@ -137,7 +370,16 @@ def download_file(file_id, format):
     
     file_path = os.path.join(STORAGE_DIR, f"{file_id}.{format}")
     if os.path.exists(file_path):
-        return send_file(file_path, as_attachment=True, download_name=f"swagger_{file_id}.{format}")
+        download_name = f"swagger_{file_id}.{format}"
+        
+        # Stored JSON is compact; only pay for indentation when asked to
+        if format == 'json' and request.args.get('pretty') == '1':
+            with open(file_path, 'rb') as f:
+                content = _json_dumps(_json_loads(f.read()), pretty=True)
+            return send_file(io.BytesIO(content), mimetype='application/json',
+                             as_attachment=True, download_name=download_name)
+        
+        return send_file(file_path, as_attachment=True, download_name=download_name)
     
     return jsonify({'error': 'File not found'}), 404
 
@@ -150,39 +392,40 @@ def swagger_ui(file_id):
 def health():
     return jsonify({'status': 'healthy'})
 
-def save_converted_file(service_name, swagger_spec, wsdl_content):
-    """Save converted file to storage"""
+def save_converted_file(service_name, swagger_spec, wsdl_content, generator=None):
+    """Save converted file to storage, returning its id and serialized JSON"""
     import uuid
-    from swagger_generator import SwaggerGenerator
     
     file_id = str(uuid.uuid4())[:8]  # Short UUID
-    timestamp = datetime.now().isoformat()
+    timestamp = time.strftime('%Y-%m-%dT%H:%M:%S')
+    
+    # The three output files are independent, so write them concurrently
+    writes = []
     
     # Save swagger as JSON
     json_path = os.path.join(STORAGE_DIR, f"{file_id}.json")
-    with open(json_path, 'w') as f:
-        json.dump(swagger_spec, f, indent=2)
+    swagger_json = _json_dumps(swagger_spec)
+    writes.append(_IO_POOL.submit(_write_atomic, json_path, swagger_json))
+    
+    # Save original WSDL
+    wsdl_path = os.path.join(STORAGE_DIR, f"{file_id}.wsdl")
+    if isinstance(wsdl_content, str):
+        wsdl_content = wsdl_content.encode('utf-8')
+    writes.append(_IO_POOL.submit(_write_atomic, wsdl_path, wsdl_content))
     
     # Save swagger as YAML
-    generator = SwaggerGenerator()
+    if generator is None:
+        generator = SwaggerGenerator()
     yaml_content = generator.to_yaml(swagger_spec)
     yaml_path = os.path.join(STORAGE_DIR, f"{file_id}.yaml")
-    with open(yaml_path, 'w') as f:
-        f.write(yaml_content)
+    writes.append(_IO_POOL.submit(_write_atomic, yaml_path, yaml_content.encode('utf-8')))
     
-    # Save original WSDL
-    wsdl_path = os.path.join(STORAGE_DIR, f"{file_id}.wsdl")
-    with open(wsdl_path, 'w') as f:
-        f.write(wsdl_content)
+    # Only record the file once everything is on disk; re-raise any write error
+    wait(writes)
+    for future in writes:
+        future.result()
     
     # Update metadata
-    metadata_file = os.path.join(STORAGE_DIR, 'metadata.json')
-    files = []
-    
-    if os.path.exists(metadata_file):
-        with open(metadata_file, 'r') as f:
-            files = json.load(f)
-    
     file_info = {
         'id': file_id,
         'name': service_name,
@@ -194,12 +437,9 @@ def save_converted_file(service_name, swagger_spec, wsdl_content):
         'schemas_count': len(swagger_spec.get('components', {}).get('schemas', {}))
     }
     
-    files.append(file_info)
-    
-    with open(metadata_file, 'w') as f:
-        json.dump(files, f, indent=2)
+    _append_metadata(file_info)
     
-    return file_id
+    return file_id, swagger_json
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,17 @@
+"""Optional build step: compile the WSDL parser with Cython.
+
+    pip install cython
+    python build_parser.py build_ext --inplace
+
+The compiled extension is imported in place of wsdl_parser.py; without it
+the pure-Python module is used unchanged. Rebuild (or delete the extension)
+after editing wsdl_parser.py, otherwise the stale build keeps running.
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='soap-to-swagger-parser',
+    ext_modules=cythonize(['wsdl_parser.py'], compiler_directives={'language_level': 3}),
+    zip_safe=False,
+)
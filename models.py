@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+class _Record:
+    """Mapping-style read access so records can be consumed like the dicts they replace"""
+    __slots__ = ()
+    
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+@dataclass(slots=True, frozen=True)
+class MessagePart(_Record):
+    name: Optional[str]
+    element: Optional[str]
+    type: Optional[str]
+
+@dataclass(slots=True, frozen=True)
+class Message(_Record):
+    name: Optional[str]
+    parts: Tuple[MessagePart, ...] = ()
+
+@dataclass(slots=True, frozen=True)
+class Fault(_Record):
+    name: Optional[str]
+    message: Optional[str]
+    documentation: Optional[str]
+
+@dataclass(slots=True, frozen=True)
+class Operation(_Record):
+    name: Optional[str]
+    documentation: Optional[str]
+    input: Optional[Message]
+    output: Optional[Message]
+    faults: Tuple[Fault, ...] = ()
+
+@dataclass(slots=True, frozen=True)
+class BindingOperation(_Record):
+    name: Optional[str]
+    soap_action: str
+
+@dataclass(slots=True, frozen=True)
+class Binding(_Record):
+    name: Optional[str]
+    type: Optional[str]
+    transport: str
+    style: str
+    operations: Tuple[BindingOperation, ...] = ()
+
+@dataclass(slots=True, frozen=True)
+class Port(_Record):
+    name: Optional[str]
+    binding: Optional[str]
+    location: Optional[str]
+
+@dataclass(slots=True, frozen=True)
+class Service(_Record):
+    name: Optional[str]
+    ports: Tuple[Port, ...] = ()
+    documentation: Optional[str] = None
@@ -1,8 +1,49 @@
 import json
+import functools
 import yaml
 from urllib.parse import urlparse
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+
+# SOAP fault example shared by every generated operation
+_SOAP_FAULT_EXAMPLE = '''<?xml version="1.0" encoding="UTF-8"?>
+<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">
+    <soap:Body>
+        <soap:Fault>
+            <faultcode>soap:Server</faultcode>
+            <faultstring>Server Error</faultstring>
+            <detail>
+                <!-- Fault details -->
+            </detail>
+        </soap:Fault>
+    </soap:Body>
+</soap:Envelope>'''
+
 class SwaggerGenerator:
+    # XSD type name -> OpenAPI schema
+    _TYPE_MAPPING = {
+        'string': {"type": "string"},
+        'int': {"type": "integer", "format": "int32"},
+        'integer': {"type": "integer"},
+        'long': {"type": "integer", "format": "int64"},
+        'short': {"type": "integer", "format": "int32"},
+        'byte': {"type": "integer", "format": "int32"},
+        'double': {"type": "number", "format": "double"},
+        'float': {"type": "number", "format": "float"},
+        'decimal': {"type": "number"},
+        'boolean': {"type": "boolean"},
+        'date': {"type": "string", "format": "date"},
+        'dateTime': {"type": "string", "format": "date-time"},
+        'time': {"type": "string", "format": "time"},
+        'base64Binary': {"type": "string", "format": "byte"},
+        'hexBinary': {"type": "string", "format": "binary"},
+        'anyURI': {"type": "string", "format": "uri"}
+    }
+    _DEFAULT = (("type", "string"),)
+    
     def __init__(self):
         self.swagger_version = "3.0.0"
     
@@ -63,6 +104,8 @@ class SwaggerGenerator:
     
     def _generate_operation_spec(self, operation, wsdl_data):
         """Generate OpenAPI operation specification"""
+        req_ex = self._generate_soap_example(operation, 'request')
+        resp_ex = self._generate_soap_example(operation, 'response')
         
         operation_spec = {
             "post": {
@@ -77,13 +120,13 @@ class SwaggerGenerator:
                         "text/xml": {
                             "schema": {
                                 "type": "string",
-                                "example": self._generate_soap_example(operation, 'request')
+                                "example": req_ex
                             }
                         },
                         "application/soap+xml": {
                             "schema": {
                                 "type": "string",
-                                "example": self._generate_soap_example(operation, 'request')
+                                "example": req_ex
                             }
                         }
                     }
@@ -95,7 +138,7 @@ class SwaggerGenerator:
                             "text/xml": {
                                 "schema": {
                                     "type": "string",
-                                    "example": self._generate_soap_example(operation, 'response')
+                                    "example": resp_ex
                                 }
                             }
                         }
@@ -106,7 +149,7 @@ class SwaggerGenerator:
                             "text/xml": {
                                 "schema": {
                                     "type": "string",
-                                    "example": self._generate_soap_fault_example()
+                                    "example": _SOAP_FAULT_EXAMPLE
                                 }
                             }
                         }
@@ -199,33 +242,20 @@ class SwaggerGenerator:
     
     def _map_type_to_openapi(self, wsdl_type):
         """Map WSDL/XSD types to OpenAPI schema"""
+        # Callers store and mutate the result, so hand out a fresh dict
+        return dict(self._openapi_type_items(wsdl_type))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _openapi_type_items(wsdl_type):
+        """Resolve a WSDL/XSD type to OpenAPI schema items, cached per type name"""
         if not wsdl_type:
-            return {"type": "string"}
+            return SwaggerGenerator._DEFAULT
         
-        # Remove namespace prefix
-        if ':' in wsdl_type:
-            wsdl_type = wsdl_type.split(':')[1]
-        
-        type_mapping = {
-            'string': {"type": "string"},
-            'int': {"type": "integer", "format": "int32"},
-            'integer': {"type": "integer"},
-            'long': {"type": "integer", "format": "int64"},
-            'short': {"type": "integer", "format": "int32"},
-            'byte': {"type": "integer", "format": "int32"},
-            'double': {"type": "number", "format": "double"},
-            'float': {"type": "number", "format": "float"},
-            'decimal': {"type": "number"},
-            'boolean': {"type": "boolean"},
-            'date': {"type": "string", "format": "date"},
-            'dateTime': {"type": "string", "format": "date-time"},
-            'time': {"type": "string", "format": "time"},
-            'base64Binary': {"type": "string", "format": "byte"},
-            'hexBinary': {"type": "string", "format": "binary"},
-            'anyURI': {"type": "string", "format": "uri"}
-        }
-        
-        return type_mapping.get(wsdl_type.lower(), {"type": "string"})
+        # Local part after any namespace prefix
+        local = wsdl_type.rpartition(':')[2]
+        schema = SwaggerGenerator._TYPE_MAPPING.get(local.lower())
+        return tuple(schema.items()) if schema is not None else SwaggerGenerator._DEFAULT
     
     def _generate_schemas(self, types):
         """Generate component schemas from WSDL types"""
@@ -291,25 +321,10 @@ class SwaggerGenerator:
     </soap:Body>
 </soap:Envelope>'''
     
-    def _generate_soap_fault_example(self):
-        """Generate SOAP fault example"""
-        return '''<?xml version="1.0" encoding="UTF-8"?>
-<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">
-    <soap:Body>
-        <soap:Fault>
-            <faultcode>soap:Server</faultcode>
-            <faultstring>Server Error</faultstring>
-            <detail>
-                <!-- Fault details -->
-            </detail>
-        </soap:Fault>
-    </soap:Body>
-</soap:Envelope>'''
-    
     def to_json(self, swagger_spec, indent=2):
         """Convert swagger spec to JSON string"""
         return json.dumps(swagger_spec, indent=indent, ensure_ascii=False)
     
     def to_yaml(self, swagger_spec):
         """Convert swagger spec to YAML string"""
-        return yaml.dump(swagger_spec, default_flow_style=False, allow_unicode=True)
+        return yaml.dump(swagger_spec, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
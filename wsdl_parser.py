@@ -1,28 +1,191 @@
-import xml.etree.ElementTree as ET
+# cython: language_level=3
 from lxml import etree
-import re
-from urllib.parse import urlparse
+import io
+import sys
+import hashlib
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
+from models import Binding, BindingOperation, Fault, Message, MessagePart, Operation, Port, Service
+
+# Namespace prefixes shared by every compiled query; treat as read-only
+NS = {
+    'wsdl': 'http://schemas.xmlsoap.org/wsdl/',
+    'soap': 'http://schemas.xmlsoap.org/wsdl/soap/',
+    'soap12': 'http://schemas.xmlsoap.org/wsdl/soap12/',
+    'xsd': 'http://www.w3.org/2001/XMLSchema'
+}
+
+# Parser settings: no ID table, no blank text nodes, no entity expansion
+_PARSER_OPTIONS = {
+    'huge_tree': True,
+    'collect_ids': False,
+    'remove_blank_text': True,
+    'resolve_entities': False
+}
+
+# Documents above this size are parsed incrementally
+_STREAM_THRESHOLD = 1_000_000
+
+# lxml parsers must not be shared between threads, so keep one per thread
+_parser_local = threading.local()
+
+def _get_parser():
+    """Return this thread's configured XMLParser"""
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = _parser_local.parser = etree.XMLParser(**_PARSER_OPTIONS)
+    return parser
+
+# XPath queries compiled once at import instead of on every call. WSDL places
+# these nodes directly under their parent, so relative queries use the child axis.
+_XP_SERVICE = etree.XPath('//wsdl:service', namespaces=NS)
+_XP_PORTTYPE = etree.XPath('//wsdl:portType', namespaces=NS)
+_XP_ALL_MESSAGES = etree.XPath('//wsdl:message', namespaces=NS)
+_XP_SCHEMA = etree.XPath('//xsd:schema', namespaces=NS)
+_XP_BINDING = etree.XPath('//wsdl:binding', namespaces=NS)
+
+# Clark-notation schema tags for walking type definitions without XPath.
+# Schema content can nest (complexContent, choice, ...), so these are matched
+# against descendants rather than direct children.
+_XSD_COMPLEX_TYPE = f"{{{NS['xsd']}}}complexType"
+_XSD_SIMPLE_TYPE = f"{{{NS['xsd']}}}simpleType"
+_XSD_ELEMENT = f"{{{NS['xsd']}}}element"
+_XSD_SEQUENCE = f"{{{NS['xsd']}}}sequence"
+_XSD_RESTRICTION = f"{{{NS['xsd']}}}restriction"
+_XSD_SCHEMA = f"{{{NS['xsd']}}}schema"
+
+# ElementPath expressions for descendant lookups inside type definitions
+_SEQUENCE_PATH = f'.//{_XSD_SEQUENCE}'
+_ELEMENT_PATH = f'.//{_XSD_ELEMENT}'
+
+WSDL_DOC = f"{{{NS['wsdl']}}}documentation"
+_WSDL_MESSAGE = f"{{{NS['wsdl']}}}message"
+_WSDL_OPERATION = f"{{{NS['wsdl']}}}operation"
+_WSDL_PART = f"{{{NS['wsdl']}}}part"
+_WSDL_INPUT = f"{{{NS['wsdl']}}}input"
+_WSDL_OUTPUT = f"{{{NS['wsdl']}}}output"
+_WSDL_FAULT = f"{{{NS['wsdl']}}}fault"
+_WSDL_PORT = f"{{{NS['wsdl']}}}port"
+_WSDL_PORT_TYPE = f"{{{NS['wsdl']}}}portType"
+_WSDL_BINDING = f"{{{NS['wsdl']}}}binding"
+_WSDL_SERVICE = f"{{{NS['wsdl']}}}service"
+_SOAP_BINDING = f"{{{NS['soap']}}}binding"
+_SOAP_OPERATION = f"{{{NS['soap']}}}operation"
+_SOAP_ADDRESSES = (f"{{{NS['soap']}}}address", f"{{{NS['soap12']}}}address")
+
+_XSD_BASE_TYPES = {
+    'string': 'string',
+    'int': 'integer',
+    'integer': 'integer',
+    'long': 'integer',
+    'short': 'integer',
+    'byte': 'integer',
+    'double': 'number',
+    'float': 'number',
+    'decimal': 'number',
+    'boolean': 'boolean',
+    'date': 'string',
+    'dateTime': 'string',
+    'time': 'string',
+    'base64Binary': 'string',
+    'hexBinary': 'string',
+    'anyURI': 'string'
+}
+
+# Raw type attribute value -> OpenAPI type, covering the bare, lowercased and
+# commonly prefixed spellings so the usual case is a single dict lookup
+XSD_TYPE_MAP = {}
+for _name, _openapi_type in _XSD_BASE_TYPES.items():
+    for _local in (_name, _name.lower()):
+        for _qname in (_local, f'xsd:{_local}', f'xs:{_local}', f's:{_local}', f"{{{NS['xsd']}}}{_local}"):
+            XSD_TYPE_MAP[_qname] = _openapi_type
+del _name, _openapi_type, _local, _qname
+
+# Common maxOccurs values and whether they denote an array
+_MAX_OCCURS_ARRAY = {'unbounded': True, '0': False, '1': False}
+
+# Longer attribute values are rarely repeated and are not worth interning
+_INTERN_MAX_LEN = 40
+
+def _intern(value):
+    """Intern short, frequently repeated attribute values"""
+    if value is None or len(value) > _INTERN_MAX_LEN:
+        return value
+    return sys.intern(value)
+
+def _read_only(value):
+    """Recursively wrap dicts in read-only mapping proxies"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _read_only(item) for key, item in value.items()})
+    return value
+
+# Top-level sections handled by the streaming parser
+_STREAM_TAGS = (_WSDL_MESSAGE, _WSDL_PORT_TYPE, _WSDL_BINDING, _WSDL_SERVICE, _XSD_SCHEMA)
 
 class WSDLParser:
+    # Parse results shared by all instances, keyed by content hash, oldest first
+    _CACHE_MAX = 32
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+    
     def __init__(self):
-        self.namespaces = {
-            'wsdl': 'http://schemas.xmlsoap.org/wsdl/',
-            'soap': 'http://schemas.xmlsoap.org/wsdl/soap/',
-            'soap12': 'http://schemas.xmlsoap.org/wsdl/soap12/',
-            'xsd': 'http://www.w3.org/2001/XMLSchema',
-            'tns': None  # Will be set dynamically
-        }
-        
+        self._message_index = {}
+        self._parsed_messages = {}
+        self.target_namespace = None
+    
     def parse(self, wsdl_content):
-        """Parse WSDL content and extract service information"""
+        """Parse WSDL content (bytes or str) and extract service information"""
+        # Parse XML, letting lxml handle the raw bytes and their declared encoding
+        if isinstance(wsdl_content, str):
+            wsdl_content = wsdl_content.encode('utf-8')
+        
+        # The same WSDL is often converted repeatedly; reuse the earlier result
+        key = hashlib.blake2b(wsdl_content).digest()
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is not None:
+            self.target_namespace = cached['target_namespace']
+            return dict(cached)
+        
+        service_info = self._parse_content(wsdl_content)
+        
+        # Cached results are shared between callers, so everything below the
+        # top-level dict is immutable: frozen records, tuples and mapping proxies
+        for section in ('operations', 'bindings', 'services'):
+            service_info[section] = tuple(service_info[section])
+        service_info['types'] = _read_only(service_info['types'])
+        
+        with self._cache_lock:
+            self._cache[key] = service_info
+            if len(self._cache) > self._CACHE_MAX:
+                self._cache.popitem(last=False)
+        
+        return dict(service_info)
+    
+    def _parse_content(self, wsdl_content):
+        """Parse encoded WSDL content without consulting the cache"""
+        self._message_index = {}
+        self._parsed_messages = {}
         try:
-            # Parse XML
-            root = etree.fromstring(wsdl_content.encode('utf-8'))
+            if len(wsdl_content) > _STREAM_THRESHOLD:
+                return self._parse_streaming(wsdl_content)
+            
+            try:
+                root = etree.fromstring(wsdl_content, _get_parser())
+            except etree.XMLSyntaxError as e:
+                raise ValueError(f"Invalid XML syntax: {e}") from e
+            
+            # Index messages by name once instead of searching the tree per operation
+            for message in _XP_ALL_MESSAGES(root):
+                self._message_index.setdefault(message.get('name'), message)
             
             # Update target namespace
             target_ns = root.get('targetNamespace')
-            if target_ns:
-                self.namespaces['tns'] = target_ns
+            self.target_namespace = target_ns
             
             # Extract service information
             service_info = {
@@ -36,147 +199,247 @@ class WSDLParser:
             }
             
             return service_info
-            
+        finally:
+            # Don't keep the parsed tree alive through the index
+            self._message_index = {}
+            self._parsed_messages = {}
+    
+    def _parse_streaming(self, wsdl_content):
+        """Extract service information in one incremental pass for large documents"""
+        types = {}
+        port_types = []
+        bindings = []
+        services = []
+        
+        context = etree.iterparse(io.BytesIO(wsdl_content), events=('end',), tag=_STREAM_TAGS,
+                                  **_PARSER_OPTIONS)
+        # Syntax errors surface while iterating, so only the loop is guarded
+        try:
+            for _, elem in context:
+                tag = elem.tag
+                if tag == _WSDL_MESSAGE:
+                    name = elem.get('name')
+                    if name not in self._parsed_messages:
+                        self._parsed_messages[name] = self._parse_message(elem)
+                elif tag == _WSDL_PORT_TYPE:
+                    # Operations may reference messages defined further down, so
+                    # port types are resolved once the whole document has been read
+                    port_types.append(elem)
+                    continue
+                elif tag == _XSD_SCHEMA:
+                    self._add_schema_types(elem, types)
+                elif tag == _WSDL_BINDING:
+                    bindings.append(self._parse_binding(elem))
+                else:
+                    services.append(self._parse_service(elem))
+                
+                # Section fully consumed; free its subtree
+                elem.clear(keep_tail=True)
         except etree.XMLSyntaxError as e:
-            raise ValueError(f"Invalid XML syntax: {str(e)}")
-        except Exception as e:
-            raise ValueError(f"Failed to parse WSDL: {str(e)}")
+            raise ValueError(f"Invalid XML syntax: {e}") from e
+        
+        root = context.root
+        operations = []
+        for port_type in port_types:
+            operations.extend(self._extract_port_type_operations(port_type))
+        
+        target_ns = root.get('targetNamespace')
+        self.target_namespace = target_ns
+        
+        if services:
+            name = services[0].name if services[0].name is not None else 'UnknownService'
+        else:
+            name = 'UnknownService'
+        
+        return {
+            'name': name,
+            'description': self._get_service_description(root),
+            'target_namespace': target_ns,
+            'operations': operations,
+            'types': types,
+            'bindings': bindings,
+            'services': services
+        }
     
     def _get_service_name(self, root):
         """Extract service name from WSDL"""
-        services = root.xpath('//wsdl:service', namespaces=self.namespaces)
+        services = _XP_SERVICE(root)
         if services:
             return services[0].get('name', 'UnknownService')
         return 'UnknownService'
     
     def _get_service_description(self, root):
         """Extract service description from documentation elements"""
-        docs = root.xpath('//wsdl:documentation', namespaces=self.namespaces)
-        if docs:
-            return docs[0].text or 'No description available'
+        doc = root.find(WSDL_DOC)
+        if doc is not None:
+            return doc.text or 'No description available'
         return 'SOAP Web Service converted from WSDL'
     
     def _extract_operations(self, root):
         """Extract operations from port types"""
         operations = []
         
-        port_types = root.xpath('//wsdl:portType', namespaces=self.namespaces)
+        port_types = _XP_PORTTYPE(root)
         for port_type in port_types:
-            ops = port_type.xpath('.//wsdl:operation', namespaces=self.namespaces)
-            for op in ops:
-                operation = {
-                    'name': op.get('name'),
-                    'documentation': self._get_element_documentation(op),
-                    'input': self._extract_message_info(root, op, 'input'),
-                    'output': self._extract_message_info(root, op, 'output'),
-                    'faults': self._extract_faults(root, op)
-                }
-                operations.append(operation)
+            operations.extend(self._extract_port_type_operations(port_type))
         
         return operations
     
-    def _extract_message_info(self, root, operation, msg_type):
+    def _extract_port_type_operations(self, port_type):
+        """Extract the operations of a single port type"""
+        operations = []
+        
+        # Bind the per-operation helpers once instead of on every iteration
+        get_doc = self._get_element_documentation
+        message_info = self._extract_message_info
+        extract_faults = self._extract_faults
+        
+        for op in port_type:
+            if op.tag != _WSDL_OPERATION:
+                continue
+            
+            # Sort the operation's message references in one pass over its children
+            input_ref = output_ref = None
+            fault_refs = []
+            for child in op:
+                tag = child.tag
+                if tag == _WSDL_INPUT:
+                    if input_ref is None:
+                        input_ref = child
+                elif tag == _WSDL_OUTPUT:
+                    if output_ref is None:
+                        output_ref = child
+                elif tag == _WSDL_FAULT:
+                    fault_refs.append(child)
+            
+            operation = Operation(
+                name=_intern(op.get('name')),
+                documentation=get_doc(op),
+                input=message_info(input_ref),
+                output=message_info(output_ref),
+                faults=extract_faults(fault_refs)
+            )
+            operations.append(operation)
+        
+        return operations
+    
+    def _extract_message_info(self, msg_element):
         """Extract input/output message information"""
-        msg_elements = operation.xpath(f'.//wsdl:{msg_type}', namespaces=self.namespaces)
-        if not msg_elements:
+        if msg_element is None:
             return None
-            
-        msg_element = msg_elements[0]
+        
         msg_name = msg_element.get('message')
         
         if msg_name:
             # Remove namespace prefix if present
-            if ':' in msg_name:
-                msg_name = msg_name.split(':')[1]
+            msg_name = msg_name.rpartition(':')[2]
+            
+            # Operations often share messages; parse each one only once. Keyed
+            # by name since the streaming parser discards message elements.
+            parsed = self._parsed_messages.get(msg_name)
+            if parsed is not None:
+                return parsed
             
             # Find message definition
-            messages = root.xpath(f'//wsdl:message[@name="{msg_name}"]', namespaces=self.namespaces)
-            if messages:
-                return self._parse_message(messages[0])
+            message = self._message_index.get(msg_name)
+            if message is not None:
+                parsed = self._parsed_messages[msg_name] = self._parse_message(message)
+                return parsed
         
         return None
     
     def _parse_message(self, message):
         """Parse message parts"""
         parts = []
-        part_elements = message.xpath('.//wsdl:part', namespaces=self.namespaces)
-        
-        for part in part_elements:
-            part_info = {
-                'name': part.get('name'),
-                'element': part.get('element'),
-                'type': part.get('type')
-            }
+        for part in message.iterfind(_WSDL_PART):
+            part_info = MessagePart(
+                name=part.get('name'),
+                element=_intern(part.get('element')),
+                type=_intern(part.get('type'))
+            )
             parts.append(part_info)
         
-        return {
-            'name': message.get('name'),
-            'parts': parts
-        }
+        return Message(name=message.get('name'), parts=tuple(parts))
     
-    def _extract_faults(self, root, operation):
+    def _extract_faults(self, fault_elements):
         """Extract fault information"""
         faults = []
-        fault_elements = operation.xpath('.//wsdl:fault', namespaces=self.namespaces)
         
         for fault in fault_elements:
-            fault_info = {
-                'name': fault.get('name'),
-                'message': fault.get('message'),
-                'documentation': self._get_element_documentation(fault)
-            }
+            fault_info = Fault(
+                name=fault.get('name'),
+                message=fault.get('message'),
+                documentation=self._get_element_documentation(fault)
+            )
             faults.append(fault_info)
         
-        return faults
+        return tuple(faults)
     
     def _extract_types(self, root):
         """Extract type definitions from schema"""
         types = {}
         
         # Look for embedded schemas
-        schemas = root.xpath('//xsd:schema', namespaces=self.namespaces)
+        schemas = _XP_SCHEMA(root)
+        add_schema_types = self._add_schema_types
         for schema in schemas:
-            # Extract complex types
-            complex_types = schema.xpath('.//xsd:complexType', namespaces=self.namespaces)
-            for ct in complex_types:
-                type_name = ct.get('name')
-                if type_name:
-                    types[type_name] = self._parse_complex_type(ct)
-            
-            # Extract simple types
-            simple_types = schema.xpath('.//xsd:simpleType', namespaces=self.namespaces)
-            for st in simple_types:
-                type_name = st.get('name')
-                if type_name:
-                    types[type_name] = self._parse_simple_type(st)
-            
-            # Extract elements
-            elements = schema.xpath('.//xsd:element', namespaces=self.namespaces)
-            for elem in elements:
-                elem_name = elem.get('name')
-                if elem_name:
-                    types[elem_name] = self._parse_element(elem)
+            add_schema_types(schema, types)
         
         return types
     
+    def _add_schema_types(self, schema, types):
+        """Add the type definitions of a single schema to types"""
+        # Collect complex types, simple types and elements in a single walk
+        complex_types = {}
+        simple_types = {}
+        elements = {}
+        for el in schema.iter(_XSD_COMPLEX_TYPE, _XSD_SIMPLE_TYPE, _XSD_ELEMENT):
+            name = el.get('name')
+            if not name:
+                continue
+            tag = el.tag
+            if tag == _XSD_COMPLEX_TYPE:
+                complex_types[name] = el
+            elif tag == _XSD_SIMPLE_TYPE:
+                simple_types[name] = el
+            else:
+                elements[name] = el
+        
+        # Elements take precedence over types of the same name
+        parse_complex_type = self._parse_complex_type
+        for type_name, ct in complex_types.items():
+            types[type_name] = parse_complex_type(ct)
+        parse_simple_type = self._parse_simple_type
+        for type_name, st in simple_types.items():
+            types[type_name] = parse_simple_type(st)
+        parse_element = self._parse_element
+        for elem_name, elem in elements.items():
+            types[elem_name] = parse_element(elem)
+    
     def _parse_complex_type(self, complex_type):
         """Parse complex type definition"""
         properties = {}
+        map_xsd_type = self._map_xsd_type
         
-        # Look for sequence elements
-        sequences = complex_type.xpath('.//xsd:sequence', namespaces=self.namespaces)
-        for seq in sequences:
-            elements = seq.xpath('.//xsd:element', namespaces=self.namespaces)
-            for elem in elements:
+        # Look for sequence elements, including those under complexContent
+        for seq in complex_type.iterfind(_SEQUENCE_PATH):
+            for elem in seq.iterfind(_ELEMENT_PATH):
                 prop_name = elem.get('name')
-                prop_type = elem.get('type', 'string')
-                min_occurs = elem.get('minOccurs', '1')
-                max_occurs = elem.get('maxOccurs', '1')
+                prop_type = _intern(elem.get('type', 'string'))
+                min_occurs = _intern(elem.get('minOccurs', '1'))
+                max_occurs = _intern(elem.get('maxOccurs', '1'))
+                
+                is_array = _MAX_OCCURS_ARRAY.get(max_occurs)
+                if is_array is None:
+                    try:
+                        is_array = int(max_occurs) > 1
+                    except ValueError:
+                        is_array = False
                 
                 properties[prop_name] = {
-                    'type': self._map_xsd_type(prop_type),
+                    'type': map_xsd_type(prop_type),
                     'required': min_occurs != '0',
-                    'array': max_occurs == 'unbounded' or (max_occurs.isdigit() and int(max_occurs) > 1)
+                    'array': is_array
                 }
         
         return {
@@ -186,9 +449,9 @@ class WSDLParser:
     
     def _parse_simple_type(self, simple_type):
         """Parse simple type definition"""
-        restrictions = simple_type.xpath('.//xsd:restriction', namespaces=self.namespaces)
-        if restrictions:
-            base_type = restrictions[0].get('base', 'string')
+        restriction = simple_type.find(_XSD_RESTRICTION)
+        if restriction is not None:
+            base_type = restriction.get('base', 'string')
             return {
                 'type': self._map_xsd_type(base_type),
                 'base': base_type
@@ -209,111 +472,82 @@ class WSDLParser:
         if not xsd_type:
             return 'string'
         
-        # Remove namespace prefix
-        if ':' in xsd_type:
-            xsd_type = xsd_type.split(':')[1]
-        
-        type_mapping = {
-            'string': 'string',
-            'int': 'integer',
-            'integer': 'integer',
-            'long': 'integer',
-            'short': 'integer',
-            'byte': 'integer',
-            'double': 'number',
-            'float': 'number',
-            'decimal': 'number',
-            'boolean': 'boolean',
-            'date': 'string',
-            'dateTime': 'string',
-            'time': 'string',
-            'base64Binary': 'string',
-            'hexBinary': 'string',
-            'anyURI': 'string'
-        }
+        mapped = XSD_TYPE_MAP.get(xsd_type)
+        if mapped is not None:
+            return mapped
         
-        return type_mapping.get(xsd_type.lower(), 'string')
+        # Unusual prefix or casing: remove namespace prefix and normalise
+        return _XSD_BASE_TYPES.get(xsd_type.rpartition(':')[2].lower(), 'string')
     
     def _extract_bindings(self, root):
         """Extract binding information"""
-        bindings = []
-        binding_elements = root.xpath('//wsdl:binding', namespaces=self.namespaces)
-        
-        for binding in binding_elements:
-            binding_info = {
-                'name': binding.get('name'),
-                'type': binding.get('type'),
-                'transport': self._get_soap_transport(binding),
-                'style': self._get_soap_style(binding),
-                'operations': self._extract_binding_operations(binding)
-            }
-            bindings.append(binding_info)
-        
-        return bindings
+        parse_binding = self._parse_binding
+        return [parse_binding(binding) for binding in _XP_BINDING(root)]
     
-    def _get_soap_transport(self, binding):
-        """Get SOAP transport from binding"""
-        soap_bindings = binding.xpath('.//soap:binding', namespaces=self.namespaces)
-        if soap_bindings:
-            return soap_bindings[0].get('transport', 'http://schemas.xmlsoap.org/soap/http')
-        return 'http://schemas.xmlsoap.org/soap/http'
-    
-    def _get_soap_style(self, binding):
-        """Get SOAP style from binding"""
-        soap_bindings = binding.xpath('.//soap:binding', namespaces=self.namespaces)
-        if soap_bindings:
-            return soap_bindings[0].get('style', 'document')
-        return 'document'
-    
-    def _extract_binding_operations(self, binding):
-        """Extract operations from binding"""
+    def _parse_binding(self, binding):
+        """Parse a single binding"""
+        # Collect SOAP settings and operations in one pass over the children
+        soap_binding = None
         operations = []
-        op_elements = binding.xpath('.//wsdl:operation', namespaces=self.namespaces)
+        for child in binding:
+            tag = child.tag
+            if tag == _WSDL_OPERATION:
+                soap_action = ''
+                for op_child in child:
+                    if op_child.tag == _SOAP_OPERATION:
+                        soap_action = op_child.get('soapAction', '')
+                        break
+                
+                operations.append(BindingOperation(name=child.get('name'), soap_action=soap_action))
+            elif tag == _SOAP_BINDING and soap_binding is None:
+                soap_binding = child
         
-        for op in op_elements:
-            soap_ops = op.xpath('.//soap:operation', namespaces=self.namespaces)
-            soap_action = soap_ops[0].get('soapAction', '') if soap_ops else ''
-            
-            operations.append({
-                'name': op.get('name'),
-                'soap_action': soap_action
-            })
+        if soap_binding is not None:
+            transport = soap_binding.get('transport', 'http://schemas.xmlsoap.org/soap/http')
+            style = soap_binding.get('style', 'document')
+        else:
+            transport = 'http://schemas.xmlsoap.org/soap/http'
+            style = 'document'
         
-        return operations
+        return Binding(
+            name=binding.get('name'),
+            type=_intern(binding.get('type')),
+            transport=transport,
+            style=style,
+            operations=tuple(operations)
+        )
     
     def _extract_services(self, root):
         """Extract service endpoint information"""
-        services = []
-        service_elements = root.xpath('//wsdl:service', namespaces=self.namespaces)
+        return [self._parse_service(service) for service in _XP_SERVICE(root)]
+    
+    def _parse_service(self, service):
+        """Parse a single service and its ports"""
+        service_ports = []
         
-        for service in service_elements:
-            ports = service.xpath('.//wsdl:port', namespaces=self.namespaces)
-            service_ports = []
+        for port in service:
+            if port.tag != _WSDL_PORT:
+                continue
             
-            for port in ports:
-                addresses = port.xpath('.//soap:address', namespaces=self.namespaces)
-                if not addresses:
-                    addresses = port.xpath('.//soap12:address', namespaces=self.namespaces)
-                
-                location = addresses[0].get('location') if addresses else ''
-                
-                service_ports.append({
-                    'name': port.get('name'),
-                    'binding': port.get('binding'),
-                    'location': location
-                })
+            location = ''
+            for child in port:
+                if child.tag in _SOAP_ADDRESSES:
+                    location = child.get('location')
+                    break
             
-            services.append({
-                'name': service.get('name'),
-                'ports': service_ports,
-                'documentation': self._get_element_documentation(service)
-            })
+            service_ports.append(Port(
+                name=port.get('name'),
+                binding=port.get('binding'),
+                location=location
+            ))
         
-        return services
+        return Service(
+            name=service.get('name'),
+            ports=tuple(service_ports),
+            documentation=self._get_element_documentation(service)
+        )
     
     def _get_element_documentation(self, element):
         """Get documentation text from element"""
-        docs = element.xpath('.//wsdl:documentation', namespaces=self.namespaces)
-        if docs and docs[0].text:
-            return docs[0].text.strip()
-        return None
+        doc = element.find(WSDL_DOC)
+        return doc.text.strip() if doc is not None and doc.text else None